@@ -3,12 +3,24 @@ This module implements the Lutron communication of the Remote Two/3 integration
 
 """
 
+import asyncio
 import logging
-from asyncio import AbstractEventLoop
-from typing import Any
+from functools import cached_property, partial
+from itertools import chain
+from asyncio import AbstractEventLoop, TimerHandle
+from typing import Any, Awaitable, Callable
 import os
-import sys
-from const import LutronCoverInfo, LutronConfig, LutronLightInfo, LutronSceneInfo
+from const import (
+    CA_CERT_PATH,
+    CERT_PATH,
+    KEY_PATH,
+    LutronConfig,
+    LutronCoverInfo,
+    LutronLightInfo,
+    LutronSceneInfo,
+    write_certificate_files,
+)
+from pylutron_caseta import BridgeDisconnectedError
 from pylutron_caseta.smartbridge import Smartbridge
 from ucapi import button, light, cover
 from ucapi_framework import (
@@ -21,6 +33,24 @@ from ucapi_framework import (
 
 _LOG = logging.getLogger(__name__)
 
+# Lutron level (0-100) to ucapi brightness (0-255)
+_PCT_TO_U8 = tuple(i * 255 // 100 for i in range(101))
+
+# Cover position (0-100) to state; anything below 5% is treated as closed
+_COVER_STATE_BY_POS = tuple(
+    cover.States.OPEN if pos >= 5 else cover.States.CLOSED for pos in range(101)
+)
+
+# Shared attribute values for the fixed on/off/open/closed command results.
+# They are never mutated, only replaced, so one instance can back every device.
+_LIGHT_OFF = LightAttributes(STATE=light.States.OFF, BRIGHTNESS=0)
+_LIGHT_ON_FULL = LightAttributes(STATE=light.States.ON, BRIGHTNESS=255)
+_COVER_OPEN = CoverAttributes(STATE=cover.States.OPEN, POSITION=100)
+_COVER_CLOSED = CoverAttributes(STATE=cover.States.CLOSED, POSITION=0)
+
+# Seconds to wait for more Lutron light changes before refreshing entities
+_LIGHT_UPDATE_DELAY = 0.05
+
 
 class SmartHub(ExternalClientDevice):
     """Representing a Lutron Smart Hub Device."""
@@ -47,6 +77,7 @@ class SmartHub(ExternalClientDevice):
         self._lights: list[LutronLightInfo] = []
         self._covers: list[LutronCoverInfo] = []
         self._scenes: list[LutronSceneInfo] = []
+        self._scene_by_id: dict[str, LutronSceneInfo] = {}
         self._scene: LutronSceneInfo | None = None
 
         # Store device state indexed by device_id (not entity_id)
@@ -54,17 +85,30 @@ class SmartHub(ExternalClientDevice):
         self._cover_states: dict[str, CoverAttributes] = {}
         self._button_states: dict[str, ButtonAttributes] = {}
 
+        # Last raw Lutron level (0-100) seen per light, used to diff refreshes
+        self._light_levels: dict[str, int] = {}
+
+        # Pending coalesced light refresh scheduled by the subscriber callback
+        self._light_update_handle: TimerHandle | None = None
+        # Device ids reported changed since the last refresh
+        self._pending_lights: set[str] = set()
+        # Subscriber callbacks per device_id, reused across reconnects
+        self._light_callbacks: dict[str, Callable[[], None]] = {}
+
+        # Set once the certificate files are known to exist on disk
+        self._certs_ready = False
+
     @property
     def device_config(self) -> LutronConfig:
         """Return the device configuration."""
         return self._device_config
 
-    @property
+    @cached_property
     def identifier(self) -> str:
         """Return the device identifier."""
         return self.device_config.identifier
 
-    @property
+    @cached_property
     def log_id(self) -> str:
         """Return a log identifier."""
         return self.device_config.identifier
@@ -114,7 +158,7 @@ class SmartHub(ExternalClientDevice):
     async def create_client(self) -> Smartbridge:
         """Create the Smartbridge client instance."""
         # Ensure certificate files exist and get their paths
-        key_path, cert_path, ca_cert_path = self._ensure_certificate_files()
+        key_path, cert_path, ca_cert_path = await self._ensure_certificate_files()
 
         return Smartbridge.create_tls(
             self._device_config.address,
@@ -125,9 +169,6 @@ class SmartHub(ExternalClientDevice):
 
     async def connect_client(self) -> None:
         """Connect the Smartbridge client."""
-        # Ensure certificate files exist before connecting
-        self._ensure_certificate_files()
-
         self._lutron_smart_hub = self._client
         await self._lutron_smart_hub.connect()
         _LOG.info("[%s] Connected to Lutron device", self.log_id)
@@ -137,41 +178,54 @@ class SmartHub(ExternalClientDevice):
         self._covers = self.get_covers()
         self._scenes = self.get_scenes()
 
-        # Initialize state for each light device
-        for light_info in self._lights:
-            self._light_states[light_info.device_id] = LightAttributes(
-                STATE=light.States.ON
-                if light_info.current_state > 0
-                else light.States.OFF,
-                BRIGHTNESS=int(light_info.current_state * 255 / 100),
-            )
-            # Subscribe to light updates
-            self._lutron_smart_hub.add_subscriber(
-                light_info.device_id, self._update_lights
+        # Initialize state for each light device; the hub reports -1 for
+        # zones whose level it has not read yet
+        self._light_levels = {
+            light_info.device_id: max(light_info.current_state, 0)
+            for light_info in self._lights
+        }
+        self._light_states = {
+            device_id: LightAttributes(
+                STATE=light.States.ON if level > 0 else light.States.OFF,
+                BRIGHTNESS=_PCT_TO_U8[level],
             )
+            for device_id, level in self._light_levels.items()
+        }
+
+        # Subscribe to light updates
+        add_subscriber = self._lutron_smart_hub.add_subscriber
+        callbacks = self._light_callbacks
+        for device_id in self._light_levels:
+            callback = callbacks.get(device_id)
+            if callback is None:
+                callback = callbacks[device_id] = partial(
+                    self._update_lights, device_id
+                )
+            add_subscriber(device_id, callback)
 
         # Initialize state for each cover device
-        for cover_info in self._covers:
-            state = (
-                cover.States.OPEN
-                if cover_info.current_state >= 5
-                else cover.States.CLOSED
-            )
-            self._cover_states[cover_info.device_id] = CoverAttributes(
-                STATE=state,
+        self._cover_states = {
+            cover_info.device_id: CoverAttributes(
+                STATE=_COVER_STATE_BY_POS[cover_info.current_state],
                 POSITION=cover_info.current_state,
             )
+            for cover_info in self._covers
+        }
 
         # Initialize state for each scene/button
-        for scene_info in self._scenes:
-            self._button_states[scene_info.scene_id] = ButtonAttributes(
-                STATE=button.States.AVAILABLE,
-            )
+        self._button_states = {
+            scene_info.scene_id: ButtonAttributes(STATE=button.States.AVAILABLE)
+            for scene_info in self._scenes
+        }
 
         self.push_update()
 
     async def disconnect_client(self) -> None:
         """Disconnect the Smartbridge client."""
+        if self._light_update_handle is not None:
+            self._light_update_handle.cancel()
+            self._light_update_handle = None
+        self._pending_lights.clear()
         if self._lutron_smart_hub:
             await self._lutron_smart_hub.close()
             self._lutron_smart_hub = None
@@ -192,93 +246,102 @@ class SmartHub(ExternalClientDevice):
         """Get button state by scene_id."""
         return self._button_states.get(scene_id)
 
-    def _update_lights(self) -> None:
+    def _update_lights(self, device_id: str) -> None:
+        """
+        Schedule a light state refresh from a Lutron subscriber callback.
+
+        The hub fires one callback per changed device, so a scene can trigger
+        dozens in a row. They are coalesced into a single refresh.
+
+        :param device_id: Lutron device_id the callback was registered for
+        """
+        self._pending_lights.add(device_id)
+        if self._light_update_handle is None:
+            # Coalesce bursts of subscriber callbacks into one refresh
+            self._light_update_handle = asyncio.get_running_loop().call_later(
+                _LIGHT_UPDATE_DELAY, self._flush_light_updates
+            )
+
+    def _flush_light_updates(self) -> None:
         """Update light states from Lutron hub and notify subscribed entities."""
-        if not self._lutron_smart_hub:
+        self._light_update_handle = None
+        pending, self._pending_lights = self._pending_lights, set()
+        if not self._lutron_smart_hub or not pending:
             return
-        try:
-            self._lights = self.get_lights()
-
-            changed = False
-            for entity in self._lights:
-                old_state = self._light_states.get(entity.device_id)
-                new_state = LightAttributes(
-                    STATE=light.States.ON
-                    if entity.current_state > 0
-                    else light.States.OFF,
-                    BRIGHTNESS=int(entity.current_state * 255 / 100),
-                )
-                if old_state != new_state:
-                    self._light_states[entity.device_id] = new_state
-                    changed = True
-
-            if changed:
-                self.push_update()
+        hub = self._lutron_smart_hub
+        changed = False
+        levels = self._light_levels
+        states = self._light_states
+        get_device = hub.get_device_by_id
+        for device_id in pending:
+            try:
+                level = max(get_device(device_id).get("current_state", 0), 0)
+            except KeyError:
+                _LOG.warning("[%s] Light %s no longer on hub", self.log_id, device_id)
+                continue
+            # Compare the raw level first; only build attributes on change
+            if levels.get(device_id) == level:
+                continue
+            levels[device_id] = level
+            new_state = LightAttributes(
+                STATE=light.States.ON if level > 0 else light.States.OFF,
+                BRIGHTNESS=_PCT_TO_U8[level],
+            )
+            if states.get(device_id) != new_state:
+                states[device_id] = new_state
+                changed = True
 
-        except Exception:  # pylint: disable=broad-exception-caught
-            _LOG.exception("[%s] Light update error", self.log_id)
+        if changed:
+            self.push_update()
 
     def get_lights(self) -> list[Any]:
         """Return the list of light entities."""
         if not self._lutron_smart_hub:
             return []
-        lights = self._lutron_smart_hub.get_devices_by_domain("light")
-        switches = self._lutron_smart_hub.get_devices_by_domain("switch")
-        light_list = []
-        for entity in lights:
-            light_list.append(
-                LutronLightInfo(
-                    device_id=entity.get("device_id", ""),
-                    current_state=entity.get("current_state", 0),
-                    type=entity.get("type", ""),
-                    name=entity.get("name", ""),
-                    model=entity.get("model", ""),
-                )
+        hub = self._lutron_smart_hub
+        # Switches are exposed as lights too
+        return [
+            LutronLightInfo(
+                device_id=entity.get("device_id", ""),
+                current_state=entity.get("current_state", 0),
+                type=entity.get("type", ""),
+                name=entity.get("name", ""),
+                model=entity.get("model", ""),
             )
-        # Merge switches into light list
-        for entity in switches:
-            light_list.append(
-                LutronLightInfo(
-                    device_id=entity.get("device_id", ""),
-                    current_state=entity.get("current_state", 0),
-                    type=entity.get("type", ""),
-                    name=entity.get("name", ""),
-                    model=entity.get("model", ""),
-                )
+            for entity in chain(
+                hub.get_devices_by_domain("light"),
+                hub.get_devices_by_domain("switch"),
             )
-        return light_list
+        ]
 
     def get_covers(self) -> list[Any]:
         """Return the list of cover entities."""
         if not self._lutron_smart_hub:
             return []
-        covers = self._lutron_smart_hub.get_devices_by_domain("cover")
-        cover_list = []
-        for entity in covers:
-            cover_list.append(
-                LutronCoverInfo(
-                    device_id=entity.get("device_id", ""),
-                    current_state=entity.get("current_state", 0),
-                    type=entity.get("type", ""),
-                    name=entity.get("name", ""),
-                    model=entity.get("model", ""),
-                )
+        return [
+            LutronCoverInfo(
+                device_id=entity.get("device_id", ""),
+                # -1 until the hub has read the shade's level
+                current_state=max(entity.get("current_state", 0), 0),
+                type=entity.get("type", ""),
+                name=entity.get("name", ""),
+                model=entity.get("model", ""),
             )
-        return cover_list
+            for entity in self._lutron_smart_hub.get_devices_by_domain("cover")
+        ]
 
     def get_scenes(self) -> list[Any]:
         """Return the list of scene entities."""
         if not self._lutron_smart_hub:
             return []
-        scenes = self._lutron_smart_hub.get_scenes()
-        scene_list = []
-        for scene in scenes.values():
-            scene_list.append(
-                LutronSceneInfo(
-                    scene_id=scene.get("scene_id", ""),
-                    name=scene.get("name", ""),
-                )
+        scene_list = [
+            LutronSceneInfo(
+                scene_id=scene.get("scene_id", ""),
+                name=scene.get("name", ""),
             )
+            for scene in self._lutron_smart_hub.get_scenes().values()
+        ]
+        self._scene_by_id = {scene.scene_id: scene for scene in scene_list}
         return scene_list
 
     async def activate_scene(self, scene_id: str) -> None:
@@ -286,9 +349,7 @@ class SmartHub(ExternalClientDevice):
         if not self._lutron_smart_hub:
             _LOG.error("[%s] Not connected", self.log_id)
             return
-        scene: LutronSceneInfo | None = next(
-            (s for s in self.scenes if s.scene_id == scene_id), None
-        )
+        scene = self._scene_by_id.get(scene_id)
         if scene is None:
             _LOG.error("[%s] Scene %s not found", self.log_id, scene_id)
             return
@@ -300,46 +361,150 @@ class SmartHub(ExternalClientDevice):
                 "[%s] Error activating scene %s: %s", self.log_id, scene.name, err
             )
 
-    async def turn_on_light(self, light_id: str, brightness: int | None = None) -> None:
-        """Turn on a light with a specific brightness."""
+    async def _safe_call(
+        self, action: str, device_id: str, operation: Callable, *args: Any
+    ) -> bool:
+        """
+        Await a single hub operation and log any failure.
+
+        :param action: Description used in the error log, e.g. "turning on light"
+        :param device_id: Lutron device_id the operation targets
+        :param operation: Smartbridge coroutine function to call
+        :return: True if the operation succeeded
+        """
+        try:
+            await operation(*args)
+        except (BridgeDisconnectedError, OSError) as err:
+            # Expected while the hub is unreachable; the watchdog reconnects
+            _LOG.warning(
+                "[%s] Bridge unavailable while %s %s: %s",
+                self.log_id,
+                action,
+                device_id,
+                err,
+            )
+            return False
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            _LOG.error("[%s] Error %s %s: %s", self.log_id, action, device_id, err)
+            return False
+        return True
+
+    async def turn_on_light(self, light_id: str, brightness: int | None = None) -> bool:
+        """
+        Turn on a light with a specific brightness.
+
+        :return: True if the hub accepted the command
+        """
         if not self._lutron_smart_hub:
             _LOG.error("[%s] Not connected", self.log_id)
-            return
-        try:
-            if brightness is not None:
-                await self._lutron_smart_hub.set_value(light_id, brightness)
-            else:
-                await self._lutron_smart_hub.turn_on(light_id)
+            return False
+        if brightness is not None:
+            ok = await self._safe_call(
+                "turning on light",
+                light_id,
+                self._lutron_smart_hub.set_value,
+                light_id,
+                brightness,
+            )
+        else:
+            ok = await self._safe_call(
+                "turning on light", light_id, self._lutron_smart_hub.turn_on, light_id
+            )
+        if not ok:
+            return False
+
+        # Record the expected level so the hub's echo is skipped; a plain turn_on
+        # restores a level only the hub knows, so let the echo report it
+        if brightness is not None:
+            self._light_levels[light_id] = brightness
+        else:
+            self._light_levels.pop(light_id, None)
 
+        if brightness is None:
+            self._light_states[light_id] = _LIGHT_ON_FULL
+        elif brightness == 0:
+            # The hub switches the light off at level 0 and its echo is skipped
+            self._light_states[light_id] = _LIGHT_OFF
+        else:
             # Convert Lutron brightness (0-100) back to ucapi (0-255)
-            ucapi_brightness = (
-                int(brightness * 255 / 100) if brightness is not None else 255
-            )
             self._light_states[light_id] = LightAttributes(
                 STATE=light.States.ON,
-                BRIGHTNESS=ucapi_brightness,
+                BRIGHTNESS=_PCT_TO_U8[brightness],
             )
-            self.push_update()
-        except Exception as err:  # pylint: disable=broad-exception-caught
-            _LOG.error("[%s] Error turning on light %s: %s", self.log_id, light_id, err)
+        self.push_update()
+        return True
+
+    async def turn_off_light(self, light_id: str) -> bool:
+        """
+        Turn off a light.
 
-    async def turn_off_light(self, light_id: str) -> None:
-        """Turn off a light."""
+        :return: True if the hub accepted the command
+        """
+        if not self._lutron_smart_hub:
+            _LOG.error("[%s] Not connected", self.log_id)
+            return False
+        if not await self._safe_call(
+            "turning off light", light_id, self._lutron_smart_hub.turn_off, light_id
+        ):
+            return False
+        self._light_levels[light_id] = 0
+
+        self._light_states[light_id] = _LIGHT_OFF
+        self.push_update()
+        return True
+
+    async def set_many(self, states: dict[str, int | None]) -> None:
+        """
+        Set several lights at once.
+
+        Commands are dispatched concurrently and a single update is pushed
+        once all of them have completed.
+
+        :param states: Mapping of Lutron device_id to level (0-100); 0 turns the
+            light off and None turns it on at the level the hub restores. Levels
+            outside 0-100 are logged and skipped.
+        """
         if not self._lutron_smart_hub:
             _LOG.error("[%s] Not connected", self.log_id)
             return
-        try:
-            await self._lutron_smart_hub.turn_off(light_id)
+        hub = self._lutron_smart_hub
+
+        valid: dict[str, int | None] = {}
+        for light_id, level in states.items():
+            if level is not None and not 0 <= level <= 100:
+                _LOG.error(
+                    "[%s] Invalid level %s for light %s", self.log_id, level, light_id
+                )
+                continue
+            valid[light_id] = level
+
+        safe_call = partial(self._safe_call, "setting light")
+
+        def command(light_id: str, level: int | None) -> Awaitable[bool]:
+            if level is None:
+                return safe_call(light_id, hub.turn_on, light_id)
+            if level > 0:
+                return safe_call(light_id, hub.set_value, light_id, level)
+            return safe_call(light_id, hub.turn_off, light_id)
+
+        results = await asyncio.gather(
+            *(command(light_id, level) for light_id, level in valid.items())
+        )
 
+        for (light_id, level), ok in zip(valid.items(), results):
+            if not ok:
+                continue
+            if level is None:
+                # Only the hub knows the restored level; let its echo report it
+                self._light_levels.pop(light_id, None)
+                self._light_states[light_id] = _LIGHT_ON_FULL
+                continue
+            self._light_levels[light_id] = level
             self._light_states[light_id] = LightAttributes(
-                STATE=light.States.OFF,
-                BRIGHTNESS=0,
-            )
-            self.push_update()
-        except Exception as err:  # pylint: disable=broad-exception-caught
-            _LOG.error(
-                "[%s] Error turning off light %s: %s", self.log_id, light_id, err
+                STATE=light.States.ON if level > 0 else light.States.OFF,
+                BRIGHTNESS=_PCT_TO_U8[level],
             )
+        self.push_update()
 
     async def open_cover(self, cover_id: str) -> None:
         """Open a cover."""
@@ -349,10 +514,7 @@ class SmartHub(ExternalClientDevice):
         try:
             await self._lutron_smart_hub.set_value(cover_id, 100)
 
-            self._cover_states[cover_id] = CoverAttributes(
-                STATE=cover.States.OPEN,
-                POSITION=100,
-            )
+            self._cover_states[cover_id] = _COVER_OPEN
             self.push_update()
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOG.error("[%s] Error opening cover %s: %s", self.log_id, cover_id, err)
@@ -365,10 +527,7 @@ class SmartHub(ExternalClientDevice):
         try:
             await self._lutron_smart_hub.set_value(cover_id, 0)
 
-            self._cover_states[cover_id] = CoverAttributes(
-                STATE=cover.States.CLOSED,
-                POSITION=0,
-            )
+            self._cover_states[cover_id] = _COVER_CLOSED
             self.push_update()
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOG.error("[%s] Error closing cover %s: %s", self.log_id, cover_id, err)
@@ -383,17 +542,25 @@ class SmartHub(ExternalClientDevice):
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOG.error("[%s] Error stopping cover %s: %s", self.log_id, cover_id, err)
 
-    async def set_cover_position(self, cover_id: str, position: int) -> None:
-        """Set cover position (0-100)."""
+    async def set_cover_position(self, cover_id: str, position: int) -> bool:
+        """
+        Set cover position (0-100).
+
+        :return: True if the position was valid and accepted by the hub
+        """
         if not self._lutron_smart_hub:
             _LOG.error("[%s] Not connected", self.log_id)
-            return
+            return False
+        if not 0 <= position <= 100:
+            _LOG.error(
+                "[%s] Invalid position %s for cover %s", self.log_id, position, cover_id
+            )
+            return False
         try:
             await self._lutron_smart_hub.set_value(cover_id, position)
 
-            state = cover.States.OPEN if position >= 5 else cover.States.CLOSED
             self._cover_states[cover_id] = CoverAttributes(
-                STATE=state,
+                STATE=_COVER_STATE_BY_POS[position],
                 POSITION=position,
             )
             self.push_update()
@@ -401,67 +568,77 @@ class SmartHub(ExternalClientDevice):
             _LOG.error(
                 "[%s] Error setting cover %s position: %s", self.log_id, cover_id, err
             )
+            return False
+        return True
+
+    async def toggle_light(self, light_id: str) -> bool:
+        """
+        Toggle a light.
 
-    async def toggle_light(self, light_id: str) -> None:
-        """Toggle a light."""
+        :return: True if the hub accepted the command
+        """
         if not self._lutron_smart_hub:
             _LOG.error("[%s] Not connected", self.log_id)
-            return
-        try:
-            is_on = self._lutron_smart_hub.is_on(light_id)
-            if is_on:
-                await self._lutron_smart_hub.turn_off(light_id)
-            else:
-                await self._lutron_smart_hub.turn_on(light_id)
+            return False
+        # Answer from tracked state; only ask the library for unknown lights
+        current = self._light_states.get(light_id)
+        if current is not None:
+            is_on = current.STATE == light.States.ON
+        else:
+            try:
+                is_on = self._lutron_smart_hub.is_on(light_id)
+            except KeyError:
+                _LOG.error("[%s] Light %s not found", self.log_id, light_id)
+                return False
+        operation = (
+            self._lutron_smart_hub.turn_off if is_on else self._lutron_smart_hub.turn_on
+        )
+        if not await self._safe_call("toggling light", light_id, operation, light_id):
+            return False
+        if is_on:
+            self._light_levels[light_id] = 0
+        else:
+            self._light_levels.pop(light_id, None)
 
-            self._light_states[light_id] = LightAttributes(
-                STATE=light.States.ON if not is_on else light.States.OFF,
-                BRIGHTNESS=255 if not is_on else 0,
-            )
-            self.push_update()
-        except Exception as err:  # pylint: disable=broad-exception-caught
-            _LOG.error("[%s] Error toggling light %s: %s", self.log_id, light_id, err)
+        self._light_states[light_id] = _LIGHT_OFF if is_on else _LIGHT_ON_FULL
+        self.push_update()
+        return True
 
-    def _ensure_certificate_files(self) -> tuple[str, str, str]:
+    async def _ensure_certificate_files(self) -> tuple[str, str, str]:
         """
         Ensure certificate files exist in the data directory.
 
-        Writes certificates from config to files if they don't exist or if force_write is True.
-        Returns the paths to the certificate files.
+        Writes certificates from config to files if they don't exist. The check
+        runs once per instance; later calls return the paths without touching disk.
+        File I/O runs in the default executor to keep the event loop free.
 
         :return: Tuple of (key_path, cert_path, ca_cert_path)
         """
-        # Determine data path - write access on remote is limited to data directory
-        if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-            data_path = os.environ["UC_DATA_HOME"]
-        else:
-            data_path = "./data"
-
-        # Create data directory if it doesn't exist
-        os.makedirs(data_path, exist_ok=True)
+        if self._certs_ready:
+            return KEY_PATH, CERT_PATH, CA_CERT_PATH
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._ensure_certificate_files_sync
+        )
 
-        # Certificate file paths
-        key_path = os.path.join(data_path, "caseta.key")
-        cert_path = os.path.join(data_path, "caseta.crt")
-        ca_cert_path = os.path.join(data_path, "caseta-bridge.crt")
+    def _ensure_certificate_files_sync(self) -> tuple[str, str, str]:
+        """Blocking part of _ensure_certificate_files()."""
+        if self._certs_ready:
+            return KEY_PATH, CERT_PATH, CA_CERT_PATH
 
         # Check if any certificate files are missing
         if (
-            not os.path.exists(key_path)
-            or not os.path.exists(cert_path)
-            or not os.path.exists(ca_cert_path)
+            not os.path.exists(KEY_PATH)
+            or not os.path.exists(CERT_PATH)
+            or not os.path.exists(CA_CERT_PATH)
         ):
             _LOG.debug(
                 "[%s] Certificate files missing, creating from config", self.log_id
             )
+            write_certificate_files(
+                self._device_config.key_bytes,
+                self._device_config.cert_bytes,
+                self._device_config.ca_cert_bytes,
+            )
 
-            with open(key_path, "w", encoding="utf-8") as key_file:
-                key_file.write(self._device_config.key)
-
-            with open(cert_path, "w", encoding="utf-8") as cert_file:
-                cert_file.write(self._device_config.cert)
-
-            with open(ca_cert_path, "w", encoding="utf-8") as ca_cert_file:
-                ca_cert_file.write(self._device_config.ca_cert)
-
-        return key_path, cert_path, ca_cert_path
+        self._certs_ready = True
+        return KEY_PATH, CERT_PATH, CA_CERT_PATH
@@ -2,8 +2,68 @@
 This module implements the Lutron constants for the Remote Two/3 integration driver.
 """
 
+import contextlib
+import os
+import sys
+import tempfile
+import threading
 from dataclasses import dataclass
 
+# Data path - write access on remote is limited to data directory
+if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+    DATA_PATH = os.environ["UC_DATA_HOME"]
+else:
+    DATA_PATH = "./data"
+
+KEY_PATH = os.path.join(DATA_PATH, "caseta.key")
+CERT_PATH = os.path.join(DATA_PATH, "caseta.crt")
+CA_CERT_PATH = os.path.join(DATA_PATH, "caseta-bridge.crt")
+
+# Serialises certificate writes from setup and every SmartHub instance
+_CERT_WRITE_LOCK = threading.Lock()
+
+
+def write_certificate_files(key: bytes, cert: bytes, ca_cert: bytes) -> None:
+    """
+    Write the pairing key and certificates to the data directory.
+
+    Each file is written to a uniquely named temporary file, flushed to disk and
+    renamed over the target, so a crash leaves either the old or the new file.
+    The directory is synced once after all renames. Safe to call from several
+    threads at once.
+
+    :param key: PEM private key, only readable by the driver itself
+    :param cert: PEM client certificate
+    :param ca_cert: PEM certificate of the hub's CA
+    """
+    with _CERT_WRITE_LOCK:
+        os.makedirs(DATA_PATH, exist_ok=True)
+
+        for path, content, mode in (
+            (KEY_PATH, key, 0o600),
+            (CERT_PATH, cert, 0o644),
+            (CA_CERT_PATH, ca_cert, 0o644),
+        ):
+            fd, tmp_path = tempfile.mkstemp(dir=DATA_PATH, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    # mkstemp creates the file as 0600
+                    os.fchmod(fd, mode)
+                    file.write(content)
+                    file.flush()
+                    os.fsync(fd)
+                os.replace(tmp_path, path)
+            except BaseException:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(tmp_path)
+                raise
+
+        dir_fd = os.open(DATA_PATH, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
 
 @dataclass
 class LutronConfig:
@@ -24,8 +84,23 @@ class LutronConfig:
     key: str = ""
     """Private key (caseta.key) as text."""
 
+    @property
+    def ca_cert_bytes(self) -> bytes:
+        """CA certificate encoded for writing to disk."""
+        return self.ca_cert.encode("ascii")
 
-@dataclass
+    @property
+    def cert_bytes(self) -> bytes:
+        """Client certificate encoded for writing to disk."""
+        return self.cert.encode("ascii")
+
+    @property
+    def key_bytes(self) -> bytes:
+        """Private key encoded for writing to disk."""
+        return self.key.encode("ascii")
+
+
+@dataclass(slots=True, frozen=True)
 class LutronLightInfo:
     device_id: str
     current_state: int
@@ -34,7 +109,7 @@ class LutronLightInfo:
     model: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LutronCoverInfo:
     device_id: str
     current_state: int
@@ -43,7 +118,7 @@ class LutronCoverInfo:
     model: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LutronSceneInfo:
     scene_id: str
     name: str
@@ -99,9 +99,10 @@ class LutronCover(CoverEntity):
                 case cover.Commands.POSITION:
                     if params and "position" in params:
                         position = params["position"]
-                        await self.device.set_cover_position(
+                        if not await self.device.set_cover_position(
                             cover_id=self._cover_id, position=position
-                        )
+                        ):
+                            return ucapi.StatusCodes.BAD_REQUEST
 
         except Exception as ex:  # pylint: disable=broad-except
             _LOG.error("Error executing command %s: %s", cmd_id, ex)
@@ -4,8 +4,8 @@ Media-player entity functions.
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import asyncio
 import logging
-import re
 from typing import Any
 
 import ucapi
@@ -17,10 +17,20 @@ from ucapi_framework import create_entity_id, LightEntity
 
 _LOG = logging.getLogger(__name__)
 
+# ucapi brightness (0-255) to Lutron level (0-100)
+_B255_TO_100 = tuple(i * 100 // 255 for i in range(256))
+
 
 class LutronLight(LightEntity):
     """Representation of a Lutron Light entity."""
 
+    _FEATURES_DIMMER = (
+        light.Features.ON_OFF,
+        light.Features.TOGGLE,
+        light.Features.DIM,
+    )
+    _FEATURES_SWITCH = (light.Features.ON_OFF, light.Features.TOGGLE)
+
     def __init__(
         self,
         config_device: LutronConfig,
@@ -37,15 +47,11 @@ class LutronLight(LightEntity):
         self.config = config_device
         self.device = device
         self.identifier = light_info.device_id
-        self.features = [
-            light.Features.ON_OFF,
-            light.Features.TOGGLE,
-            light.Features.DIM,
-        ]
-
-        if re.search(r"claro", light_info.type, re.IGNORECASE):
-            if light.Features.DIM in self.features:
-                self.features.remove(light.Features.DIM)
+        # Claro devices are plain switches and cannot dim
+        if "claro" in light_info.type.lower():
+            self.features = list(self._FEATURES_SWITCH)
+        else:
+            self.features = list(self._FEATURES_DIMMER)
 
         super().__init__(
             self._entity_id,
@@ -58,6 +64,10 @@ class LutronLight(LightEntity):
             cmd_handler=self.cmd_handler,
         )
 
+        # Latest brightness waiting to be sent while a previous one is in flight
+        self._pending_brightness: int | None = None
+        self._brightness_task: asyncio.Task | None = None
+
         if device:
             self.subscribe_to_device(device)
 
@@ -70,6 +80,28 @@ class LutronLight(LightEntity):
             return
         self.update(state)
 
+    async def _set_brightness(self, brightness: int) -> bool:
+        """
+        Send a brightness level, coalescing values that arrive while busy.
+
+        Dragging a slider produces a burst of commands; only the most recent
+        value queued during an in-flight write is sent afterwards.
+
+        :return: True if the last level sent was accepted by the hub
+        """
+        self._pending_brightness = brightness
+        if self._brightness_task is None or self._brightness_task.done():
+            self._brightness_task = asyncio.create_task(self._send_brightness())
+        return await asyncio.shield(self._brightness_task)
+
+    async def _send_brightness(self) -> bool:
+        """Send pending brightness levels until none is left."""
+        ok = True
+        while self._pending_brightness is not None:
+            brightness, self._pending_brightness = self._pending_brightness, None
+            ok = await self.device.turn_on_light(self.identifier, brightness=brightness)
+        return ok
+
     # pylint: disable=too-many-statements
     async def cmd_handler(
         self,
@@ -88,41 +120,47 @@ class LutronLight(LightEntity):
         :param params: optional command parameters
         :return: status code of the command. StatusCodes.OK if the command succeeded.
         """
-        _LOG.info(
-            "Got %s command request: %s %s", entity.id, cmd_id, params if params else ""
-        )
+        _LOG.debug("Got %s command request: %s %s", entity.id, cmd_id, params or "")
 
         if not self.device:
             _LOG.error("Device not available")
             return ucapi.StatusCodes.SERVICE_UNAVAILABLE
 
+        ok = True
         try:
             match cmd_id:
                 case light.Commands.ON:
-                    brightness = None
-                    if params and Attributes.BRIGHTNESS in params:
-                        brightness = int(params[Attributes.BRIGHTNESS])
-                        brightness = int(brightness * 100 / 255)
-                        if brightness < 0 or brightness > 100:
+                    value = params.get(Attributes.BRIGHTNESS) if params else None
+                    if value is not None:
+                        try:
+                            brightness = int(value)
+                        except (TypeError, ValueError):
+                            brightness = -1
+                        if brightness < 0 or brightness > 255:
                             _LOG.error(
                                 "Invalid brightness value %s for command %s",
-                                brightness,
+                                value,
                                 cmd_id,
                             )
                             return ucapi.StatusCodes.BAD_REQUEST
-
-                    await self.device.turn_on_light(
-                        f"{self.identifier}", brightness=brightness
-                    )
+                        ok = await self._set_brightness(_B255_TO_100[brightness])
+                    else:
+                        self._pending_brightness = None
+                        ok = await self.device.turn_on_light(self.identifier)
                 case light.Commands.OFF:
-                    _LOG.debug("Sending OFF command to Light")
-                    await self.device.turn_off_light(f"{self.identifier}")
+                    # A newer command supersedes any queued brightness
+                    self._pending_brightness = None
+                    ok = await self.device.turn_off_light(self.identifier)
                 case light.Commands.TOGGLE:
-                    _LOG.debug("Sending TOGGLE command to Light")
-                    await self.device.toggle_light(f"{self.identifier}")
+                    self._pending_brightness = None
+                    ok = await self.device.toggle_light(self.identifier)
 
         except Exception as ex:  # pylint: disable=broad-except
+            # Never let an error escape: ucapi would drop the remote's session
             _LOG.error("Error executing command %s: %s", cmd_id, ex)
-            return ucapi.StatusCodes.BAD_REQUEST
-        _LOG.debug("Command %s executed successfully", cmd_id)
+            return ucapi.StatusCodes.SERVER_ERROR
+        if not ok:
+            # The bridge has already logged why the hub rejected the command
+            return ucapi.StatusCodes.SERVICE_UNAVAILABLE
+        _LOG.debug("Command %s executed successfully on %s", cmd_id, self.identifier)
         return ucapi.StatusCodes.OK
@@ -2,13 +2,21 @@
 
 """Module that includes all functions needed for the setup and reconfiguration process"""
 
+import asyncio
 import logging
-import os
-import sys
-from ipaddress import ip_address
+import re
+import socket
+import ssl
 from typing import Any
 
-from const import LutronConfig
+from const import (
+    CA_CERT_PATH,
+    CERT_PATH,
+    KEY_PATH,
+    LutronConfig,
+    write_certificate_files,
+)
+from pylutron_caseta import BridgeResponseError
 from pylutron_caseta.pairing import async_pair
 from pylutron_caseta.smartbridge import Smartbridge
 from ucapi import RequestUserInput, SetupError
@@ -16,6 +24,73 @@ from ucapi_framework import BaseSetupFlow
 
 _LOG = logging.getLogger(__name__)
 
+# A single DNS label: 1-63 characters, no leading or trailing hyphen
+_HOSTNAME_LABEL_RE = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?$")
+
+# Pairing results by address, kept until setup succeeds so that retrying after a
+# failed connection test does not need another button press on the hub. Entries
+# are evicted after _PAIRING_TTL seconds so abandoned keys do not linger.
+_PAIRING_CACHE: dict[str, dict[str, str]] = {}
+_PAIRING_TTL = 300.0
+
+# The setup screens are static; they are built once and never mutated
+_MANUAL_ENTRY_FORM = RequestUserInput(
+    {"en": "Lutron Caseta Setup"},
+    [
+        {
+            "id": "info",
+            "label": {
+                "en": "Setup your Lutron Caseta Device",
+            },
+            "field": {
+                "label": {
+                    "value": {
+                        "en": (
+                            "Please supply the IP address or hostname of your Lutron Caseta Device."
+                        ),
+                    }
+                }
+            },
+        },
+        {
+            "field": {"text": {"value": ""}},
+            "id": "address",
+            "label": {
+                "en": "IP Address or Hostname",
+            },
+        },
+        {
+            "id": "setup_info",
+            "label": {
+                "en": "",
+            },
+            "field": {
+                "label": {
+                    "value": {
+                        "en": "After pressing 'Next', press the small black button on the back of your Lutron Caseta Smart Hub to complete the pairing process.",
+                    }
+                }
+            },
+        },
+    ],
+)
+
+_DISCOVERY_FIELDS = (
+    {
+        "id": "info",
+        "label": {
+            "en": "",
+        },
+        "field": {
+            "label": {
+                "value": {
+                    "en": "After pressing 'Next', press the small black button on the back of your Lutron Caseta Smart Hub to complete the pairing process.",
+                }
+            }
+        },
+    },
+)
+
 
 class LutronSetupFlow(BaseSetupFlow[LutronConfig]):
     """
@@ -30,46 +105,7 @@ class LutronSetupFlow(BaseSetupFlow[LutronConfig]):
 
         :return: RequestUserInput with form fields for manual configuration
         """
-        return RequestUserInput(
-            {"en": "Lutron Caseta Setup"},
-            [
-                {
-                    "id": "info",
-                    "label": {
-                        "en": "Setup your Lutron Caseta Device",
-                    },
-                    "field": {
-                        "label": {
-                            "value": {
-                                "en": (
-                                    "Please supply the IP address of your Lutron Caseta Device."
-                                ),
-                            }
-                        }
-                    },
-                },
-                {
-                    "field": {"text": {"value": ""}},
-                    "id": "address",
-                    "label": {
-                        "en": "IP Address",
-                    },
-                },
-                {
-                    "id": "setup_info",
-                    "label": {
-                        "en": "",
-                    },
-                    "field": {
-                        "label": {
-                            "value": {
-                                "en": "After pressing 'Next', press the small black button on the back of your Lutron Caseta Smart Hub to complete the pairing process.",
-                            }
-                        }
-                    },
-                },
-            ],
-        )
+        return _MANUAL_ENTRY_FORM
 
     def get_additional_discovery_fields(self) -> list[dict]:
         """
@@ -77,21 +113,7 @@ class LutronSetupFlow(BaseSetupFlow[LutronConfig]):
 
         :return: List of dictionaries defining additional fields
         """
-        return [
-            {
-                "id": "info",
-                "label": {
-                    "en": "",
-                },
-                "field": {
-                    "label": {
-                        "value": {
-                            "en": "After pressing 'Next', press the small black button on the back of your Lutron Caseta Smart Hub to complete the pairing process.",
-                        }
-                    }
-                },
-            },
-        ]
+        return list(_DISCOVERY_FIELDS)
 
     async def query_device(
         self, input_values: dict[str, Any]
@@ -103,49 +125,37 @@ class LutronSetupFlow(BaseSetupFlow[LutronConfig]):
         """
 
         address = input_values["address"]
-        data = await async_pair(address)
-
-        # Store certificates in variables to be saved in config
-        ca_cert = data["ca"]
-        cert = data["cert"]
-        key = data["key"]
 
+        # Validate before pairing, which needs the user to press the hub button
         if address != "":
-            # Check if input is a valid ipv4 or ipv6 address
-            try:
-                ip_address(address)
-            except ValueError:
-                _LOG.error("The entered ip address %s is not valid", address)
+            if not _is_valid_address(address):
+                _LOG.error("The entered address %s is not valid", address)
                 return self.get_manual_entry_form()
 
-            _LOG.info("Entered ip address: %s", address)
-
-            try:
-                # Get data path - write access on remote is limited to data directory
-                data_path = get_path()
+            _LOG.info("Entered address: %s", address)
 
-                # Create data directory if it doesn't exist
-                os.makedirs(data_path, exist_ok=True)
+            data = await _get_pairing(address)
 
-                # Write certificates to files in data directory for connection test
-                key_path = os.path.join(data_path, "caseta.key")
-                cert_path = os.path.join(data_path, "caseta.crt")
-                ca_cert_path = os.path.join(data_path, "caseta-bridge.crt")
+            # Store certificates in variables to be saved in config
+            ca_cert = data["ca"]
+            cert = data["cert"]
+            key = data["key"]
 
-                with open(key_path, "w", encoding="utf-8") as key_file:
-                    key_file.write(key)
-
-                with open(cert_path, "w", encoding="utf-8") as cert_file:
-                    cert_file.write(cert)
-
-                with open(ca_cert_path, "w", encoding="utf-8") as ca_cert_file:
-                    ca_cert_file.write(ca_cert)
+            try:
+                # Write certificates to files in data directory for connection test;
+                # the file I/O and fsync run off the event loop
+                await asyncio.to_thread(
+                    write_certificate_files,
+                    key.encode("ascii"),
+                    cert.encode("ascii"),
+                    ca_cert.encode("ascii"),
+                )
 
                 lutron_smart_hub: Smartbridge = Smartbridge.create_tls(
                     address,
-                    key_path,
-                    cert_path,
-                    ca_cert_path,
+                    KEY_PATH,
+                    CERT_PATH,
+                    CA_CERT_PATH,
                 )
                 try:
                     await lutron_smart_hub.connect()
@@ -154,6 +164,7 @@ class LutronSetupFlow(BaseSetupFlow[LutronConfig]):
                     await lutron_smart_hub.close()
 
                 smarthub = devices["1"]
+                _PAIRING_CACHE.pop(address, None)
 
                 return LutronConfig(
                     identifier=smarthub["serial"],
@@ -166,17 +177,54 @@ class LutronSetupFlow(BaseSetupFlow[LutronConfig]):
                 )
 
             except Exception as ex:  # pylint: disable=broad-exception-caught
-                _LOG.error("Unable to connect at IP: %s. Exception: %s", address, ex)
-                _LOG.info(
-                    "Please check if you entered the correct ip of the lutron hub"
+                if isinstance(ex, (ssl.SSLError, BridgeResponseError)):
+                    # The hub rejected these credentials; pair again next time
+                    _PAIRING_CACHE.pop(address, None)
+                _LOG.error(
+                    "Unable to connect to address %s. Exception: %s", address, ex
                 )
+                _LOG.info("Please check the address entered for the lutron hub")
                 return self.get_manual_entry_form()
         else:
-            _LOG.info("No ip address entered")
+            _LOG.info("No address entered")
             return self.get_manual_entry_form()
 
 
-def get_path() -> str:
-    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-        return os.environ["UC_DATA_HOME"]
-    return "./data"
+async def _get_pairing(address: str) -> dict[str, str]:
+    """Return pairing data for address, reusing a recent unconsumed pairing."""
+    data = _PAIRING_CACHE.get(address)
+    if data is None:
+        data = _PAIRING_CACHE[address] = await async_pair(address)
+        asyncio.get_running_loop().call_later(
+            _PAIRING_TTL, _expire_pairing, address, data
+        )
+    return data
+
+
+def _expire_pairing(address: str, data: dict[str, str]) -> None:
+    """Evict a cached pairing unless it has already been replaced."""
+    if _PAIRING_CACHE.get(address) is data:
+        del _PAIRING_CACHE[address]
+
+
+def _is_valid_address(address: str) -> bool:
+    """Return True if address is an IPv4/IPv6 address or a plausible hostname."""
+    family = socket.AF_INET6 if ":" in address else socket.AF_INET
+    literal = address
+    if family == socket.AF_INET6:
+        # Link-local addresses may carry a zone, e.g. fe80::1%eth0
+        literal, sep, zone = address.partition("%")
+        if sep and not zone:
+            return False
+    try:
+        socket.inet_pton(family, literal)
+        return True
+    except OSError:
+        pass
+    if family == socket.AF_INET6 or len(address) > 253:
+        return False
+    # Anything made only of digits and dots was meant as an IPv4 address
+    if not address.strip("0123456789."):
+        return False
+    labels = address.removesuffix(".").split(".")
+    return all(_HOSTNAME_LABEL_RE.match(label) for label in labels)